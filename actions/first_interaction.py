@@ -1,6 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 import requests
@@ -24,7 +25,7 @@ def get_event_content(event) -> Tuple[int, str, str, str, str, str, str]:
     if name == "issues":
         item = data["issue"]
         issue_type = "issue"
-    elif name in ["pull_request", "pull_request_target"]:
+    elif name in {"pull_request", "pull_request_target"}:
         pr_number = data["pull_request"]["number"]
         item = event.get_repo_data(f"pulls/{pr_number}")
         issue_type = "pull request"
@@ -330,12 +331,6 @@ For more guidance, please refer to our [Contributing Guide](https://docs.ultraly
 
     prompt = f"""Generate a customized response to the new GitHub {issue_type} below:
 
-CONTEXT:
-- Repository: {repo_name}
-- Organization: {org_name}
-- Repository URL: {repo_url}
-- User: {username}
-
 INSTRUCTIONS:
 - Do not answer the question or resolve the issue directly
 - Adapt the example {issue_type} response below as appropriate, keeping all badges, links and references provided
@@ -350,6 +345,12 @@ INSTRUCTIONS:
 EXAMPLE {issue_type.upper()} RESPONSE:
 {example}
 
+CONTEXT:
+- Repository: {repo_name}
+- Organization: {org_name}
+- Repository URL: {repo_url}
+- User: {username}
+
 {issue_type.upper()} TITLE:
 {title}
 
@@ -376,12 +377,16 @@ def main(*args, **kwargs):
     """Executes auto-labeling and custom response generation for new GitHub issues, PRs, and discussions."""
     event = Action(*args, **kwargs)
     number, node_id, title, body, username, issue_type, action = get_event_content(event)
-    available_labels = event.get_repo_data("labels")
+    with ThreadPoolExecutor(max_workers=2) as executor:  # fetch repository and current labels concurrently
+        labels_future = executor.submit(event.get_repo_data, "labels?per_page=100")  # default page size 30 truncates
+        if issue_type != "discussion":
+            issue_labels_future = executor.submit(event.get_repo_data, f"issues/{number}/labels")
+    available_labels = labels_future.result()
     label_descriptions = {label["name"]: label.get("description", "") for label in available_labels}
-    if issue_type == "discussion":
-        current_labels = []  # For discussions, labels may need to be fetched differently or adjusted
-    else:
-        current_labels = [label["name"].lower() for label in event.get_repo_data(f"issues/{number}/labels")]
+    # For discussions, labels may need to be fetched differently or adjusted
+    current_labels = (
+        [] if issue_type == "discussion" else [label["name"].lower() for label in issue_labels_future.result()]
+    )
     if relevant_labels := get_relevant_labels(issue_type, title, body, label_descriptions, current_labels):
         apply_labels(event, number, node_id, relevant_labels, issue_type)
         if "Alert" in relevant_labels and not is_org_member(event, username):
@@ -158,7 +158,7 @@ query($owner: String!, $repo: String!, $pr_number: Int!) {
         # Add commit authors and committers that have GitHub accounts linked
         for commit in data["commits"]["nodes"]:
             commit_data = commit["commit"]
-            for user_type in ["author", "committer"]:
+            for user_type in ("author", "committer"):
                 if user := commit_data[user_type].get("user"):
                     if login := user.get("login"):
                         contributors.add(login)
@@ -203,7 +203,7 @@ query($owner: String!, $repo: String!, $pr_number: Int!) {
 
 def remove_todos_on_merge(pr_number, repository, headers):
     """Removes specified labels from PR."""
-    for label in ["TODO"]:  # Can be extended with more labels in the future
+    for label in ("TODO",):  # Can be extended with more labels in the future
         requests.delete(f"{GITHUB_API_URL}/repos/{repository}/issues/{pr_number}/labels/{label}", headers=headers)
 
 
@@ -4,7 +4,9 @@ import os
 import re
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 
 import requests
 
@@ -19,6 +21,8 @@ from .utils import (
 CURRENT_TAG = os.getenv("CURRENT_TAG")
 PREVIOUS_TAG = os.getenv("PREVIOUS_TAG")
 
+PR_NUMBER_PATTERN = re.compile(r"#(\d+)")  # i.e. "Fix bug (#123)" -> "123"
+
 
 def get_release_diff(repo_name: str, previous_tag: str, latest_tag: str, headers: dict) -> str:
     """Retrieves the differences between two specified Git tags in a GitHub repository."""
@@ -37,14 +41,14 @@ def get_prs_between_tags(repo_name: str, previous_tag: str, latest_tag: str, hea
     pr_numbers = set()
 
     for commit in data["commits"]:
-        pr_matches = re.findall(r"#(\d+)", commit["commit"]["message"])
-        pr_numbers.update(pr_matches)
+        pr_numbers.update(PR_NUMBER_PATTERN.findall(commit["commit"]["message"]))
 
     prs = []
     time.sleep(10)  # sleep 10 seconds to allow final PR summary to update on merge
-    for pr_number in sorted(pr_numbers):  # earliest to latest
-        pr_url = f"{GITHUB_API_URL}/repos/{repo_name}/pulls/{pr_number}"
-        pr_response = requests.get(pr_url, headers=headers)
+    pr_urls = [f"{GITHUB_API_URL}/repos/{repo_name}/pulls/{pr_number}" for pr_number in sorted(pr_numbers)]
+    with ThreadPoolExecutor(max_workers=8) as executor:  # fetch PRs concurrently, capped for secondary rate limits
+        pr_responses = list(executor.map(partial(requests.get, headers=headers), pr_urls))
+    for pr_response in pr_responses:  # earliest to latest
         if pr_response.status_code == 200:
             pr_data = pr_response.json()
             prs.append(
@@ -164,11 +168,12 @@ def main(*args, **kwargs):
 
     previous_tag = PREVIOUS_TAG or get_previous_tag()
 
-    # Get the diff between the tags
-    diff = get_release_diff(action.repository, previous_tag, CURRENT_TAG, action.headers_diff)
-
-    # Get PRs merged between the tags
-    prs = get_prs_between_tags(action.repository, previous_tag, CURRENT_TAG, action.headers)
+    # Get the diff and the PRs merged between the tags concurrently as the requests are independent
+    compare = (action.repository, previous_tag, CURRENT_TAG)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        diff_future = executor.submit(get_release_diff, *compare, action.headers_diff)
+        prs_future = executor.submit(get_prs_between_tags, *compare, action.headers)
+    diff, prs = diff_future.result(), prs_future.result()
 
     # Generate release summary
     try:
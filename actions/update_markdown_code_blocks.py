@@ -1,17 +1,25 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
 import hashlib
+import os
 import re
 import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+CODE_BLOCK_PATTERN = re.compile(
+    r"^( *)```(?:python|py|\{[ ]*\.py[ ]*\.annotate[ ]*\})\n(.*?)\n\1```", re.DOTALL | re.MULTILINE
+)
+SKIP_DIRS = frozenset({".git", "__pycache__"})  # directories that never contain user markdown
+
 
 def extract_code_blocks(markdown_content):
     """Extracts Python code blocks from markdown content using regex pattern matching."""
-    pattern = r"^( *)```(?:python|py|\{[ ]*\.py[ ]*\.annotate[ ]*\})\n(.*?)\n\1```"
-    code_block_pattern = re.compile(pattern, re.DOTALL | re.MULTILINE)
-    return code_block_pattern.findall(markdown_content)
+    if "```" not in markdown_content:  # fast path, no fenced code blocks
+        return []
+    return CODE_BLOCK_PATTERN.findall(markdown_content)
 
 
 def remove_indentation(code_block, num_spaces):
@@ -24,8 +32,8 @@ def remove_indentation(code_block, num_spaces):
 def add_indentation(code_block, num_spaces):
     """Adds specified number of leading spaces to non-empty lines in a code block."""
     indent = " " * num_spaces
-    lines = code_block.split("\n")
-    indented_lines = [indent + line if line.strip() != "" else line for line in lines]
+    lines = code_block.split("\n")  # split on "\n" only, str.splitlines() also breaks on separators like "\x0c"
+    indented_lines = [indent + line if line and not line.isspace() else line for line in lines]
     return "\n".join(indented_lines)
 
 
@@ -95,7 +103,8 @@ def generate_temp_filename(file_path, index):
 def process_markdown_file(file_path, temp_dir, verbose=False):
     """Processes a markdown file, extracting Python code blocks for formatting and updating the original file."""
     try:
-        markdown_content = Path(file_path).read_text()
+        markdown_content = Path(file_path).read_bytes().decode("utf-8")
+        markdown_content = markdown_content.replace("\r\n", "\n").replace("\r", "\n")  # universal newlines
         code_blocks = extract_code_blocks(markdown_content)
         temp_files = []
 
@@ -107,8 +116,7 @@ def process_markdown_file(file_path, temp_dir, verbose=False):
 
             # Generate a unique temp file path
             temp_file_path = temp_dir / generate_temp_filename(file_path, i)
-            with open(temp_file_path, "w") as temp_file:
-                temp_file.write(code_without_indentation)
+            temp_file_path.write_bytes(code_without_indentation.encode("utf-8"))
             temp_files.append((num_spaces, code_block, temp_file_path))
 
         return markdown_content, temp_files
@@ -120,50 +128,79 @@ def process_markdown_file(file_path, temp_dir, verbose=False):
 
 def update_markdown_file(file_path, markdown_content, temp_files):
     """Updates a markdown file with formatted Python code blocks extracted and processed externally."""
+    formatted_blocks = []
     for num_spaces, original_code_block, temp_file_path in temp_files:
         try:
-            with open(temp_file_path) as temp_file:
-                formatted_code = temp_file.read().rstrip("\n")  # Strip trailing newlines
-            formatted_code_with_indentation = add_indentation(formatted_code, num_spaces)
-
-            # Replace both `python` and `py` code blocks
-            for lang in ["python", "py", "{ .py .annotate }"]:
-                markdown_content = markdown_content.replace(
-                    f"{' ' * num_spaces}```{lang}\n{original_code_block}\n{' ' * num_spaces}```",
-                    f"{' ' * num_spaces}```{lang}\n{formatted_code_with_indentation}\n{' ' * num_spaces}```",
-                )
+            formatted_code = Path(temp_file_path).read_bytes().decode("utf-8").rstrip("\n")  # Strip trailing newlines
+            formatted_blocks.append(add_indentation(formatted_code, num_spaces))
         except Exception as e:
             print(f"Error updating code block in file {file_path}: {e}")
-
+            formatted_blocks.append(original_code_block)
+
+    # Splice formatted blocks back in a single pass, matches are in the same order as extract_code_blocks()
+    parts, end = [], 0
+    for match, formatted_block in zip(CODE_BLOCK_PATTERN.finditer(markdown_content), formatted_blocks):
+        parts += [markdown_content[end : match.start(2)], formatted_block]
+        end = match.end(2)
+    parts.append(markdown_content[end:])
+    updated_content = "".join(parts)
+    if updated_content == markdown_content:
+        return  # already formatted, skip rewriting the file
+
+    # Write to a unique temp file beside the real target (resolving symlinks) and atomically replace it
+    target_path, temp_path = Path(file_path).resolve(), None
     try:
-        with open(file_path, "w") as file:
-            file.write(markdown_content)
+        fd, temp_path = tempfile.mkstemp(dir=target_path.parent, prefix=f".{target_path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(updated_content.encode("utf-8"))
+        shutil.copymode(target_path, temp_path)
+        os.replace(temp_path, target_path)
     except Exception as e:
         print(f"Error writing file {file_path}: {e}")
+        if temp_path:
+            Path(temp_path).unlink(missing_ok=True)  # don't leave temp files behind in the repository
+
+
+def find_markdown_files(root_dir):
+    """Recursively finds markdown files in a directory using os.scandir to avoid redundant stat calls."""
+    markdown_files, dirs = [], [str(root_dir)]
+    while dirs:
+        try:
+            with os.scandir(dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            dirs.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        markdown_files.append(Path(entry.path))
+        except OSError:
+            continue  # skip unreadable directories, matching Path.rglob()
+    return markdown_files
 
 
 def main(root_dir=Path.cwd(), verbose=False):
     """Processes markdown files, extracts and formats Python code blocks, and updates the original files."""
     root_path = Path(root_dir)
-    markdown_files = list(root_path.rglob("*.md"))
+    markdown_files = find_markdown_files(root_path)
     temp_dir = Path("temp_code_blocks")
     temp_dir.mkdir(exist_ok=True)
 
-    # Extract code blocks and save to temp files
+    # Extract code blocks and save to temp files, reading files concurrently as this is I/O-bound
     all_temp_files = []
-    for markdown_file in markdown_files:
-        if verbose:
-            print(f"Processing {markdown_file}")
-        markdown_content, temp_files = process_markdown_file(markdown_file, temp_dir)
-        if markdown_content and temp_files:
-            all_temp_files.append((markdown_file, markdown_content, temp_files))
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = executor.map(lambda x: process_markdown_file(x, temp_dir), markdown_files)
+        for markdown_file, (markdown_content, temp_files) in zip(markdown_files, results):
+            if verbose:
+                print(f"Processing {markdown_file}")
+            if markdown_content and temp_files:
+                all_temp_files.append((markdown_file, markdown_content, temp_files))
 
     # Format all code blocks with ruff
     format_code_with_ruff(temp_dir)
 
-    # Update markdown files with formatted code blocks
-    for markdown_file, markdown_content, temp_files in all_temp_files:
-        update_markdown_file(markdown_file, markdown_content, temp_files)
+    # Update markdown files with formatted code blocks, files are independent so write them concurrently
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda x: update_markdown_file(*x), all_temp_files))
 
     # Clean up temp directory
     shutil.rmtree(temp_dir)
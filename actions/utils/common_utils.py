@@ -57,10 +57,14 @@ URL_PATTERN = re.compile(
     r")"
 )
 
+HTML_COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+
 
 def remove_html_comments(body: str) -> str:
     """Removes HTML comments from a string using regex pattern matching."""
-    return re.sub(r"<!--.*?-->", "", body, flags=re.DOTALL).strip()
+    if not body or "<!--" not in body:  # fast path, also handles None bodies from the GitHub API
+        return (body or "").strip()
+    return HTML_COMMENT_PATTERN.sub("", body).strip()
 
 
 def clean_url(url):
@@ -0,0 +1,11 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+from actions.utils.common_utils import remove_html_comments
+
+
+def test_remove_html_comments():
+    """Tests that HTML comments are stripped from bodies, including empty and missing ones."""
+    assert remove_html_comments(None) == ""
+    assert remove_html_comments("") == ""
+    assert remove_html_comments("  Plain body without comments.\n") == "Plain body without comments."
+    assert remove_html_comments("<!-- template -->\nBody <!-- inline -->text\n<!--\nmulti\nline\n-->") == "Body text"
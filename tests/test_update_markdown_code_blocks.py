@@ -0,0 +1,133 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+
+import pytest
+
+from actions.update_markdown_code_blocks import (
+    add_indentation,
+    extract_code_blocks,
+    find_markdown_files,
+    process_markdown_file,
+    remove_indentation,
+    update_markdown_file,
+)
+
+MARKDOWN = """# Title
+
+```python
+x=1
+```
+
+Some text.
+
+  ```py
+  y  =  2
+  ```
+
+```bash
+ls
+```
+"""
+
+
+@pytest.fixture
+def markdown_file(tmp_path):
+    """Writes MARKDOWN to a README.md file and returns its path along with the processed content and temp files."""
+    file_path = tmp_path / "README.md"
+    file_path.write_text(MARKDOWN)
+    temp_dir = tmp_path / "temp"
+    temp_dir.mkdir()
+    return (file_path, *process_markdown_file(file_path, temp_dir))
+
+
+def test_extract_code_blocks():
+    """Tests that only Python code blocks are extracted along with their indentation."""
+    assert extract_code_blocks(MARKDOWN) == [("", "x=1"), ("  ", "  y  =  2")]
+    assert extract_code_blocks("No code blocks here.") == []
+
+
+def test_process_markdown_file_crlf(tmp_path):
+    """Tests that code blocks are extracted from markdown files with CRLF line endings."""
+    file_path = tmp_path / "README.md"
+    file_path.write_bytes(b"# T\r\n\r\n```python\r\nx=1\r\n```\r\n")
+    temp_dir = tmp_path / "temp"
+    temp_dir.mkdir()
+
+    markdown_content, temp_files = process_markdown_file(file_path, temp_dir)
+    assert markdown_content == "# T\n\n```python\nx=1\n```\n"
+    assert [code_block for _, code_block, _ in temp_files] == ["x=1"]
+
+
+def test_indentation_round_trip():
+    """Tests that indentation is added to non-blank lines only and can be removed again."""
+    code = "def f():\n\n    return 1"
+    indented = add_indentation(code, 2)
+    assert indented == "  def f():\n\n      return 1"
+    assert remove_indentation(indented, 2) == code
+
+    code = 's = "a\x0cb\u2028c"\nt = 1'  # separators split by str.splitlines() but not by the markdown formatter
+    indented = add_indentation(code, 4)
+    assert indented == '    s = "a\x0cb\u2028c"\n    t = 1'
+    assert remove_indentation(indented, 4) == code
+
+
+def test_update_markdown_file(markdown_file):
+    """Tests that formatted code blocks are spliced back into the markdown file in order."""
+    file_path, markdown_content, temp_files = markdown_file
+    for (_, _, temp_file_path), formatted in zip(temp_files, ["x = 1\n", "y = 2\n"]):
+        temp_file_path.write_text(formatted)  # simulate ruff formatting
+    update_markdown_file(file_path, markdown_content, temp_files)
+
+    expected = MARKDOWN.replace("x=1", "x = 1").replace("y  =  2", "y = 2")
+    assert file_path.read_text() == expected
+
+
+def test_update_markdown_file_unchanged(markdown_file):
+    """Tests that markdown files whose code blocks are already formatted are not rewritten."""
+    file_path, markdown_content, temp_files = markdown_file
+    mtime = file_path.stat().st_mtime_ns
+    update_markdown_file(file_path, markdown_content, temp_files)  # temp files hold the original code
+    assert file_path.stat().st_mtime_ns == mtime
+    assert file_path.read_text() == MARKDOWN
+
+
+def test_update_markdown_file_symlink(markdown_file):
+    """Tests that updating a symlinked markdown file writes to its target and keeps the link intact."""
+    target_path, markdown_content, temp_files = markdown_file
+    link_path = target_path.with_name("index.md")
+    link_path.symlink_to(target_path)
+    temp_files[0][2].write_text("x = 1\n")  # simulate ruff formatting
+    update_markdown_file(link_path, markdown_content, temp_files)
+
+    assert link_path.is_symlink()
+    assert target_path.read_text() == MARKDOWN.replace("x=1", "x = 1")
+
+
+def test_update_markdown_file_write_error(markdown_file, monkeypatch):
+    """Tests that a failed write leaves the original file untouched and no temp files behind."""
+    file_path, markdown_content, temp_files = markdown_file
+    temp_files[0][2].write_text("x = 1\n")  # simulate ruff formatting
+
+    def copymode(*args):
+        raise OSError("simulated failure")
+
+    monkeypatch.setattr("shutil.copymode", copymode)
+    update_markdown_file(file_path, markdown_content, temp_files)
+
+    assert file_path.read_text() == MARKDOWN
+    assert sorted(p.name for p in file_path.parent.iterdir()) == ["README.md", "temp"]
+
+
+def test_find_markdown_files(tmp_path):
+    """Tests that markdown files are found recursively, skipping pruned and symlinked directories."""
+    (tmp_path / "docs" / "guide").mkdir(parents=True)
+    (tmp_path / "README.md").write_text(MARKDOWN)
+    (tmp_path / "docs" / "guide" / "index.md").write_text(MARKDOWN)
+    (tmp_path / "docs" / "notes.txt").write_text("not markdown")
+    (tmp_path / "folder.md").mkdir()  # directory with a markdown suffix
+    for skip_dir in (".git", "__pycache__"):
+        (tmp_path / skip_dir).mkdir()
+        (tmp_path / skip_dir / "skipped.md").write_text(MARKDOWN)
+    (tmp_path / "linked").symlink_to(tmp_path / "docs", target_is_directory=True)
+
+    found = sorted(path.relative_to(tmp_path).as_posix() for path in find_markdown_files(tmp_path))
+    assert found == ["README.md", "docs/guide/index.md"]